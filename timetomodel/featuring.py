@@ -5,6 +5,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -196,10 +197,21 @@ def add_lags(
         )
     )
 
-    lag_names = [l for l in lags]
-
+    # Build all lag columns as rows of one NaN-padded sliding window view,
+    # instead of allocating a shifted copy of the column per lag.
+    values = df[column].to_numpy()
+    pad_front = max(max(lags), 0)  # room for lags (past values)
+    pad_back = max(-min(lags), 0)  # room for leads (future values)
+    padded = np.concatenate(
+        (
+            np.full(pad_front, np.nan),
+            values.astype(np.float64, copy=False),
+            np.full(pad_back, np.nan),
+        )
+    )
+    windows = np.lib.stride_tricks.sliding_window_view(padded, len(df))
     for lag in lags:
-        lag_name = lag_names[lags.index(lag)]
-        df[column + "_" + lag_to_suffix(lag_name)] = df[column].shift(lag)
+        # windows[pad_front - lag] equals df[column].shift(lag)
+        df[column + "_" + lag_to_suffix(lag)] = windows[pad_front - lag]
 
     return df
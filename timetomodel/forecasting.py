@@ -86,6 +86,8 @@ def make_rolling_forecasts(
     feature_frame: pd.DataFrame = construct_features(
         (model_specs.start_of_training, end), model_specs
     )
+    # the model inputs (all but the outcome column), sliced per step below
+    regressor_frame = feature_frame.iloc[:, 1:]
 
     pd_frequency = timedelta_to_pandas_freq_str(model_specs.frequency)
     values = pd.Series(
@@ -100,7 +102,7 @@ def make_rolling_forecasts(
         model, specs = update_model(
             time_step, model, model_specs, feature_frame=feature_frame
         ).split()
-        features = feature_frame.loc[time_step:time_step].iloc[:, 1:]
+        features = regressor_frame.loc[time_step:time_step]
         values[time_step] = make_forecast_for(model_specs, features, model)
         time_step = time_step + model_specs.frequency
 
@@ -1,12 +1,9 @@
-import inspect
 import logging
 import os
-import warnings
 from datetime import datetime, timedelta, tzinfo
 from pprint import pformat
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
-import numpy as np
 import pandas as pd
 import pytz
 from sqlalchemy.dialects import postgresql
@@ -27,9 +24,6 @@ Specs for the context of your model and how to treat your model data.
 DEFAULT_RATIO_TRAINING_TESTING_DATA = 2 / 3
 DEFAULT_REMODELING_FREQUENCY = timedelta(days=1)
 
-np.seterr(all="warn")
-warnings.filterwarnings("error", message="invalid value encountered in power")
-
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +55,22 @@ class SeriesSpecs(object):
     resampling_config: Dict[str, Any]
     interpolation_config: Dict[str, Any]
 
+    __slots__ = (
+        "name",
+        "column",
+        "original_tz",
+        "feature_transformation",
+        "post_load_processing",
+        "resampling_config",
+        "interpolation_config",
+        "__series_type__",
+        "_load_cache",
+        "_caching_allowed",
+        "_pre_validated",
+        "_resample_kwargs",
+        "_agg_name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -78,10 +88,28 @@ class SeriesSpecs(object):
         self.post_load_processing = post_load_processing
         self.resampling_config = resampling_config
         self.interpolation_config = interpolation_config
+        # parse the resampling config once, so resample_data does not have to
+        # re-derive kwargs and aggregation name on every call
+        if resampling_config:
+            self._resample_kwargs = {
+                k: v for k, v in resampling_config.items() if k != "aggregation"
+            }
+            self._agg_name = resampling_config.get("aggregation")
+        else:
+            self._resample_kwargs = None
+            self._agg_name = None
         self.__series_type__ = self.__class__.__name__
+        # Loaded & checked data per expected frequency. Only used by subclasses
+        # which hold their data in memory (they set _caching_allowed to True),
+        # so repeated loads (e.g. in rolling forecasts) skip redundant work.
+        self._load_cache: Dict[timedelta, pd.Series] = {}
+        self._caching_allowed = False
+        # subclasses which check the index and normalize the time zone at
+        # construction time set this to True, so loads can skip re-validation
+        self._pre_validated = False
 
     def as_dict(self):
-        return vars(self)
+        return _slotted_attributes(self)
 
     def _load_series(self) -> pd.Series:
         """Subclasses overwrite this function to get the raw data.
@@ -119,30 +147,54 @@ class SeriesSpecs(object):
            You can check if a time window would be feasible, i.e. if enough data is loaded, and get suggestions.
            The time window is a tuple stating the index of the first and the index of the last data point.
         """
-        data = self._load_series().sort_index()
+        data = (
+            self._load_cache.get(expected_frequency) if self._caching_allowed else None
+        )
+        if data is None:
+            data = self._load_series().sort_index()
 
-        # check if data has a DateTimeIndex
-        if not isinstance(data.index, pd.DatetimeIndex):
-            raise IncompatibleModelSpecs(
-                "Loaded series has no DatetimeIndex, but %s" % type(data.index).__name__
-            )
+            if not self._pre_validated:
+                # check if data has a DateTimeIndex
+                if not isinstance(data.index, pd.DatetimeIndex):
+                    raise IncompatibleModelSpecs(
+                        "Loaded series has no DatetimeIndex, but %s"
+                        % type(data.index).__name__
+                    )
 
-        # make sure we have a time zone (default to UTC), save original time zone
-        if data.index.tzinfo is None:
-            self.original_tz = pytz.utc
-            data.index = data.index.tz_localize(self.original_tz)
-        else:
-            self.original_tz = data.index.tzinfo
+                # make sure we have a time zone (default to UTC), save original time zone
+                if data.index.tzinfo is None:
+                    self.original_tz = pytz.utc
+                    data.index = data.index.tz_localize(self.original_tz)
+                else:
+                    self.original_tz = data.index.tzinfo
 
-        # Raise error if data is empty or contains nan values
-        if data.empty:
-            raise MissingData(
-                "No values found in requested %s data. It's no use to continue I'm afraid."
-            )
-        if data.isnull().values.any() and self.interpolation_config is None:
-            raise NaNData(
-                "Nan values found in the requested %s data. It's no use to continue I'm afraid."
-            )
+            # Raise error if data is empty or contains nan values
+            if data.empty:
+                raise MissingData(
+                    "No values found in requested %s data. It's no use to continue I'm afraid."
+                )
+            if data.hasnans and self.interpolation_config is None:
+                raise NaNData(
+                    "Nan values found in the requested %s data. It's no use to continue I'm afraid."
+                )
+
+            # check if time series frequency is okay, if not then resample, and check again
+            expected_freq_str = timedelta_to_pandas_freq_str(expected_frequency)
+            if data.index.freqstr != expected_freq_str:
+                data = self.resample_data(data, expected_frequency)
+
+                if data.index.freqstr != expected_freq_str:
+                    raise IncompatibleModelSpecs(
+                        "Loaded data for %s has different frequency (%s) than used in model specs expect (%s)."
+                        % (self.name, data.index.freqstr, expected_freq_str)
+                    )
+
+            # interpolate after the frequency is set (setting the frequency may have created additional nan values)
+            if self.interpolation_config is not None:
+                data = self.interpolate_data(data)
+
+            if self._caching_allowed:
+                self._load_cache[expected_frequency] = data
 
         # check if we have enough data for the expected time window
         if check_datetime_index_window is not None:
@@ -170,57 +222,34 @@ class SeriesSpecs(object):
             if error_msg:
                 raise MissingData(error_msg)
 
-        # check if time series frequency is okay, if not then resample, and check again
-        if data.index.freqstr != timedelta_to_pandas_freq_str(expected_frequency):
-            data = self.resample_data(data, expected_frequency)
-
-            if data.index.freqstr != timedelta_to_pandas_freq_str(expected_frequency):
-                raise IncompatibleModelSpecs(
-                    "Loaded data for %s has different frequency (%s) than used in model specs expect (%s)."
-                    % (
-                        self.name,
-                        data.index.freqstr,
-                        timedelta_to_pandas_freq_str(expected_frequency),
-                    )
-                )
-
-        # interpolate after the frequency is set (setting the frequency may have created additional nan values)
-        if self.interpolation_config is not None:
-            data = self.interpolate_data(data)
-
         if transform_features and self.feature_transformation is not None:
+            if self._caching_allowed:
+                # guard the cached data against in-place transformations
+                data = data.copy()
             data = self.feature_transformation.transform_series(data)
 
         return data
 
     def resample_data(self, data, expected_frequency) -> pd.Series:
-        if self.resampling_config is None:
+        if self._resample_kwargs is None:
             data = data.resample(
                 timedelta_to_pandas_freq_str(expected_frequency)
             ).mean()
         else:
             data_resampler = data.resample(
                 timedelta_to_pandas_freq_str(expected_frequency),
-                **{
-                    k: v
-                    for k, v in self.resampling_config.items()
-                    if k != "aggregation"
-                }
+                **self._resample_kwargs
             )
-            if "aggregation" not in self.resampling_config:
+            if self._agg_name is None:
                 data = data_resampler.mean()
             else:
-                for agg_name, agg_method in inspect.getmembers(
-                    data_resampler, inspect.ismethod
-                ):
-                    if self.resampling_config["aggregation"] == agg_name:
-                        data = agg_method()
-                        break
-                else:
+                agg_method = getattr(data_resampler, self._agg_name, None)
+                if agg_method is None or not callable(agg_method):
                     raise IncompatibleModelSpecs(
                         "Cannot find resampling aggregation %s on %s"
-                        % (self.resampling_config["aggregation"], data_resampler)
+                        % (self._agg_name, data_resampler)
                     )
+                data = agg_method()
         return data
 
     def interpolate_data(self, data) -> pd.Series:
@@ -244,6 +273,8 @@ class ObjectSeriesSpecs(SeriesSpecs):
 
     data: pd.Series
 
+    __slots__ = ("_data",)
+
     def __init__(
         self,
         data: pd.Series,
@@ -267,7 +298,29 @@ class ObjectSeriesSpecs(SeriesSpecs):
                 "Please provide a DatetimeIndex. Only found %s."
                 % type(data.index).__name__
             )
+        # normalize the time zone once up front (default to UTC), so every load
+        # can take the cheap path in load_series instead of localizing again
+        if data.index.tzinfo is None:
+            data = data.tz_localize(pytz.utc)
+            self.original_tz = pytz.utc
+        else:
+            self.original_tz = data.index.tzinfo
         self.data = data
+        # the data is held in memory, so repeated loads can be served from cache,
+        # and the index was just checked and localized, so loads can skip
+        # re-validation (a post-load processing step might be stateful or alter
+        # the index, so play it safe then)
+        self._caching_allowed = post_load_processing is None
+        self._pre_validated = post_load_processing is None
+
+    @property
+    def data(self) -> pd.Series:
+        return self._data
+
+    @data.setter
+    def data(self, data: pd.Series):
+        self._data = data
+        self._load_cache.clear()
 
     def _load_series(self) -> pd.Series:
         if self.post_load_processing is not None:
@@ -285,6 +338,8 @@ class DFFileSeriesSpecs(SeriesSpecs):
     time_column: str
     value_column: str
 
+    __slots__ = ("file_path", "time_column", "value_column")
+
     def __init__(
         self,
         file_path: str,
@@ -332,6 +387,8 @@ class CSVFileSeriesSpecs(SeriesSpecs):
     value_column: str
     read_csv_config: Dict[str, Any]
 
+    __slots__ = ("file_path", "time_column", "value_column", "read_csv_config")
+
     def __init__(
         self,
         file_path: str,
@@ -389,6 +446,8 @@ class DBSeriesSpecs(SeriesSpecs):
     db: Engine
     query: Query
 
+    __slots__ = ("db_engine", "query")
+
     def __init__(
         self,
         db_engine: Engine,
@@ -417,15 +476,14 @@ class DBSeriesSpecs(SeriesSpecs):
             % self.query.column_descriptions[0]["entity"].__tablename__
         )
 
-        df = pd.DataFrame(
-            self.query.all(),
-            columns=[col["name"] for col in self.query.column_descriptions],
+        df = pd.read_sql_query(
+            self.query.statement,
+            self.db_engine,
+            parse_dates={"datetime": {"utc": True}},
         )
 
         self.check_data(df)
 
-        df["datetime"] = pd.to_datetime(df["datetime"], utc=True)
-
         if self.post_load_processing is not None:
             df = self.post_load_processing.transform_dataframe(df)
 
@@ -445,7 +503,7 @@ class DBSeriesSpecs(SeriesSpecs):
                     render_query(self.query.statement, dialect=postgresql.dialect()),
                 )
             )
-        if df.isnull().values.any():
+        if df.isna().any().any():
             raise NaNData(
                 "Nan values found in database for the requested %s data. It's no use to continue I'm afraid."
                 " Here's a print-out of the database query:\n\n%s\n\n"
@@ -479,6 +537,23 @@ class ModelSpecs(object):
     model_filename: str
     remodel_frequency: timedelta
 
+    __slots__ = (
+        "outcome_var",
+        "model_type",
+        "model_params",
+        "library_name",
+        "frequency",
+        "horizon",
+        "lags",
+        "regressors",
+        "start_of_training",
+        "end_of_testing",
+        "ratio_training_testing_data",
+        "creation_time",
+        "model_filename",
+        "remodel_frequency",
+    )
+
     def __init__(
         self,
         outcome_var: Union[SeriesSpecs, pd.Series],
@@ -509,8 +584,8 @@ class ModelSpecs(object):
             self.regressors = []
         else:
             self.regressors = [
-                parse_series_specs(r, "Regressor%d" % (regressors.index(r) + 1))
-                for r in regressors
+                parse_series_specs(r, "Regressor%d" % (i + 1))
+                for i, r in enumerate(regressors)
             ]
         self.start_of_training = start_of_training
         self.end_of_testing = end_of_testing
@@ -532,10 +607,21 @@ class ModelSpecs(object):
         self.remodel_frequency = remodel_frequency
 
     def as_dict(self):
-        return vars(self)
+        return _slotted_attributes(self)
 
     def __repr__(self):
-        return "ModelSpecs: <%s>" % pformat(vars(self))
+        """Short summary, cheap enough for logging - the embedded series can be
+        huge, so see full_repr for a complete dump."""
+        return "ModelSpecs(outcome=%s, frequency=%s, horizon=%s, lags=%s)" % (
+            self.outcome_var.name,
+            self.frequency,
+            self.horizon,
+            self.lags,
+        )
+
+    def full_repr(self) -> str:
+        """Dump all attributes, including the (potentially large) series data."""
+        return "ModelSpecs: <%s>" % pformat(self.as_dict())
 
     def set_model(
         self, model: Union[Type, Tuple[Type, dict]], library_name: Optional[str] = None
@@ -562,6 +648,19 @@ class ModelSpecs(object):
         self.library_name = library_name
 
 
+def _slotted_attributes(obj) -> Dict[str, Any]:
+    """Collect the attributes of a slot-backed instance (and any __dict__ attributes
+    which subclasses without __slots__ may have added) into a dict."""
+    attributes = {
+        attr: getattr(obj, attr)
+        for cls in reversed(type(obj).__mro__)
+        for attr in getattr(cls, "__slots__", ())
+        if hasattr(obj, attr)
+    }
+    attributes.update(getattr(obj, "__dict__", {}))
+    return attributes
+
+
 def parse_series_specs(
     specs: Union[SeriesSpecs, pd.Series], name: str = None
 ) -> SeriesSpecs:
@@ -25,26 +25,14 @@ def create_dummy_model_state(
     Create a dummy model. data increases linearly, regressor is constant (useless).
     Use two different ways to define Series specs to test them.
     """
-    dt_range = pd.date_range(
-        data_start,
-        data_start + timedelta(hours=data_range_in_hours),
-        closed="left",
-        freq="1H",
-    )
+    dt_range = pd.date_range(data_start, periods=data_range_in_hours, freq="1H")
     reg_range = pd.date_range(
-        data_start,
-        data_start + timedelta(hours=data_range_in_hours) + timedelta(days=1),
-        closed="left",
-        freq="1H",
+        data_start, periods=data_range_in_hours + 24, freq="1H"
     )  # 1 additional day of regressor data is available
-    outcome_values = [0]
-    regressor_values = [5]
-    for i in range(1, len(dt_range)):
-        outcome_values.append(outcome_values[i - 1] + 1)
-    for i in range(1, len(reg_range)):
-        regressor_values.append(5)
+    outcome_values = np.arange(len(dt_range))
+    regressor_values = np.full(len(reg_range), 5, dtype=np.int64)
     outcome_series = pd.Series(index=dt_range, data=outcome_values)
-    regressor_series = pd.Series(index=reg_range, data=regressor_values)
+    regressor_series = pd.Series(regressor_values, index=reg_range, copy=False)
     specs = modelling.ModelSpecs(
         outcome_var=speccing.ObjectSeriesSpecs(
             outcome_series,
@@ -74,12 +62,9 @@ def create_dummy_model_state(
 
 class MyDFPostProcessing(transforming.Transformation):
     def transform_dataframe(self, df: pd.DataFrame):
-        """Keep the most recent observation, drop duplicates"""
-        return (
-            df.sort_values(by=["horizon"], ascending=True)
-            .drop_duplicates(subset=["datetime"], keep="first")
-            .sort_values(by=["datetime"])
-        )
+        """Keep the most recent observation (smallest horizon), drop duplicates"""
+        idx = df.groupby("datetime", sort=False)["horizon"].idxmin()
+        return df.loc[idx].sort_values(by=["datetime"])
 
 
 class MyAdditionTransformation(transforming.ReversibleTransformation):
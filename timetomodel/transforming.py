@@ -1,4 +1,5 @@
 import logging
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -93,14 +94,22 @@ class BoxCoxTransformation(ReversibleTransformation):
                 "Box-Cox transformation not suitable for x with both positive and negative values."
             )
         self._set_params(**params)
-        return pd.Series(index=orig_index, data=y)
+        # y is a freshly computed array, so we can wrap it without copying
+        return pd.Series(y, index=orig_index, copy=False)
 
     def back_transform_value(self, x):
         try:
-            y = (
-                BoxCox.untransform_boxcox(BoxCox(), x, lmbda=self.params.lambda1)
-                - self.params.lambda2
-            ) / self.params.lambda3
+            # raise on invalid values in the power operation, so we can return
+            # a fallback value - kept local, as process-global warning settings
+            # would slow down and surprise unrelated NumPy code
+            with np.errstate(all="warn"), warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "error", message="invalid value encountered in power"
+                )
+                y = (
+                    BoxCox.untransform_boxcox(BoxCox(), x, lmbda=self.params.lambda1)
+                    - self.params.lambda2
+                ) / self.params.lambda3
         except Warning as w:
             logger.debug(  # not sure if this needs to be a warning, it happens quite often to me right now
                 "Back-transform failed for y(x, lambda1, lambda2, lambda3) with:\n"
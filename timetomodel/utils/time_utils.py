@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Tuple, Union
 
 import pandas as pd
@@ -7,7 +8,7 @@ from pandas.tseries.frequencies import to_offset
 
 
 def tz_aware_utc_now() -> datetime:
-    return datetime.utcnow().replace(tzinfo=pytz.utc)
+    return datetime.now(timezone.utc)
 
 
 def get_most_recent_quarter(dt: datetime = None) -> datetime:
@@ -36,6 +37,7 @@ def to_15_min_lags(lags: List[timedelta]) -> List[int]:
     return [int(lag.days * 96 + lag.seconds / 900) for lag in lags]
 
 
+@lru_cache(maxsize=None)
 def timedelta_to_pandas_freq_str(resolution: timedelta) -> str:
     """Translate a timedelta to a frequency name string used by Pandas.
 